@@ -12,7 +12,7 @@ class Aliases:
     def __init__(self, aliases_file):
         self.aliases_file = Path(aliases_file)
         self.aliases_seed = AliasesDefault.aliases_seed
-        self.aliases = AliasesDefault.aliases
+        self.aliases = AliasesDefault.aliases.copy()
 
         # find aliases file
         if not self.aliases_file.is_file():
@@ -52,8 +52,7 @@ class Aliases:
         If arg is not registered as alias, empty string will be returned.
         supposed to be called from bot.on_message
         """
-        ret = self.aliases.get(arg)
-        return ret if ret else ''
+        return self.aliases.get(arg, '')
             
 class AliasesDefault:
     aliases_file = 'config/aliases.json'
@@ -48,6 +48,8 @@ log = logging.getLogger(__name__)
 
 
 class MusicBot(discord.Client):
+    _command_names = None
+
     def __init__(self, config_file=None, perms_file=None, aliases_file=None):
         try:
             sys.stdout.write("\x1b]2;MusicBot {}\x07".format(BOTVERSION))
@@ -237,7 +239,7 @@ class MusicBot(discord.Client):
             if excluding_me and member == vchannel.guild.me:
                 return False
 
-            if excluding_deaf and any([member.deaf, member.self_deaf]):
+            if excluding_deaf and (member.deaf or member.self_deaf):
                 return False
 
             if member.bot:
@@ -775,8 +777,9 @@ class MusicBot(discord.Client):
             pathlib.Path('data/%s/' % guild.id).mkdir(exist_ok=True)
 
         with open('data/server_names.txt', 'w', encoding='utf8') as f:
-            for guild in sorted(self.guilds, key=lambda s:int(s.id)):
-                f.write('{:<22} {}\n'.format(guild.id, guild.name))
+            f.write(''.join(
+                '{:<22} {}\n'.format(guild.id, guild.name) for guild in sorted(self.guilds, key=lambda s:int(s.id))
+            ))
 
         if not self.config.save_videos and os.path.isdir(AUDIO_CACHE_PATH):
             if self._delete_old_audiocache():
@@ -1339,7 +1342,7 @@ class MusicBot(discord.Client):
             if 'open.spotify.com' in song_url:
                 song_url = 'spotify:' + re.sub('(http[s]?:\/\/)?(open.spotify.com)\/', '', song_url).replace('/', ':')
                 # remove session id (and other query stuff)
-                song_url = re.sub('\?.*', '', song_url)
+                song_url = song_url.partition('?')[0]
             if song_url.startswith('spotify:'):
                 parts = song_url.split(":")
                 try:
@@ -1847,7 +1850,6 @@ class MusicBot(discord.Client):
             prog_str = ('`[{progress}]`' if streaming else '`[{progress}/{total}]`').format(
                 progress=song_progress, total=song_total
             )
-            prog_bar_str = ''
 
             # percentage shows how much of the current song has already been played
             percentage = 0.0
@@ -1856,33 +1858,27 @@ class MusicBot(discord.Client):
 
             # create the actual bar
             progress_bar_length = 30
-            for i in range(progress_bar_length):
-                if (percentage < 1 / progress_bar_length * i):
-                    prog_bar_str += '□'
-                else:
-                    prog_bar_str += '■'
+            prog_bar_str = ''.join(
+                '□' if percentage < 1 / progress_bar_length * i else '■' for i in range(progress_bar_length)
+            )
 
             action_text = self.str.get('cmd-np-action-streaming', 'Streaming') if streaming else self.str.get('cmd-np-action-playing', 'Playing')
 
-            if player.current_entry.meta.get('channel', False) and player.current_entry.meta.get('author', False):
-                np_text = self.str.get('cmd-np-reply-author', "Now {action}: **{title}** added by **{author}**\nProgress: {progress_bar} {progress}\n\N{WHITE RIGHT POINTING BACKHAND INDEX} <{url}>").format(
-                    action=action_text,
-                    title=player.current_entry.title,
-                    author=player.current_entry.meta['author'].name,
-                    progress_bar=prog_bar_str,
-                    progress=prog_str,
-                    url=player.current_entry.url
-                )
+            entry = player.current_entry
+            entry_author = entry.meta.get('channel', False) and entry.meta.get('author', False)
+            if entry_author:
+                np_fmt = self.str.get('cmd-np-reply-author', "Now {action}: **{title}** added by **{author}**\nProgress: {progress_bar} {progress}\n\N{WHITE RIGHT POINTING BACKHAND INDEX} <{url}>")
             else:
-
-                np_text = self.str.get('cmd-np-reply-noauthor', "Now {action}: **{title}**\nProgress: {progress_bar} {progress}\n\N{WHITE RIGHT POINTING BACKHAND INDEX} <{url}>").format(
-
-                    action=action_text,
-                    title=player.current_entry.title,
-                    progress_bar=prog_bar_str,
-                    progress=prog_str,
-                    url=player.current_entry.url
-                )
+                np_fmt = self.str.get('cmd-np-reply-noauthor', "Now {action}: **{title}**\nProgress: {progress_bar} {progress}\n\N{WHITE RIGHT POINTING BACKHAND INDEX} <{url}>")
+
+            np_text = np_fmt.format(
+                action=action_text,
+                title=entry.title,
+                author=entry_author.name if entry_author else '',
+                progress_bar=prog_bar_str,
+                progress=prog_str,
+                url=entry.url
+            )
 
             self.server_specific_data[guild]['last_np_msg'] = await self.safe_send_message(channel, np_text)
             await self._manual_delete_check(message)
@@ -2251,20 +2247,27 @@ class MusicBot(discord.Client):
                 lines.append(self.str.get('cmd-queue-playing-noauthor', "Currently playing: `{0}` {1}\n").format(player.current_entry.title, prog_str))
 
 
+        currentlinesum = sum(len(x) + 1 for x in lines)  # +1 is for newline char
+
+        # these don't change per entry, so look them up once
+        entry_author_fmt = self.str.get('cmd-queue-entry-author', '{0} -- `{1}` by `{2}`')
+        entry_noauthor_fmt = self.str.get('cmd-queue-entry-noauthor', '{0} -- `{1}`')
+        queue_length = self.config.queue_length
+        max_len = DISCORD_MSG_CHAR_LIMIT - len(andmoretext)
+
         for i, item in enumerate(player.playlist, 1):
             if item.meta.get('channel', False) and item.meta.get('author', False):
-                nextline = self.str.get('cmd-queue-entry-author', '{0} -- `{1}` by `{2}`').format(i, item.title, item.meta['author'].name).strip()
+                nextline = entry_author_fmt.format(i, item.title, item.meta['author'].name).strip()
             else:
-                nextline = self.str.get('cmd-queue-entry-noauthor', '{0} -- `{1}`').format(i, item.title).strip()
+                nextline = entry_noauthor_fmt.format(i, item.title).strip()
 
-            currentlinesum = sum(len(x) + 1 for x in lines)  # +1 is for newline char
-
-            if (currentlinesum + len(nextline) + len(andmoretext) > DISCORD_MSG_CHAR_LIMIT) or (i > self.config.queue_length):
+            if (currentlinesum + len(nextline) > max_len) or (i > queue_length):
                 if currentlinesum + len(andmoretext):
                     unlisted += 1
                     continue
 
             lines.append(nextline)
+            currentlinesum += len(nextline) + 1
 
         if unlisted:
             lines.append(self.str.get('cmd-queue-more', '\n... and %s more') % unlisted)
@@ -2437,14 +2440,16 @@ class MusicBot(discord.Client):
         permissions = self.permissions.for_user(user)    
                     
         if user == author:
-            lines = ['Command permissions in %s\n' % guild.name, '```', '```']
+            lines = ['Command permissions in %s\n' % guild.name, '```']
         else:
-            lines = ['Command permissions for {} in {}\n'.format(user.name, guild.name), '```', '```']
+            lines = ['Command permissions for {} in {}\n'.format(user.name, guild.name), '```']
 
-        for perm in permissions.__dict__:
-            if perm in ['user_list'] or permissions.__dict__[perm] == set():
+        for perm, value in permissions.__dict__.items():
+            if perm == 'user_list' or value == set():
                 continue
-            lines.insert(len(lines) - 1, "%s: %s" % (perm, permissions.__dict__[perm]))
+            lines.append("%s: %s" % (perm, value))
+
+        lines.append('```')
 
         await self.safe_send_message(author, '\n'.join(lines))
         return Response("\N{OPEN MAILBOX WITH RAISED FLAG}", delete_after=20)
@@ -2864,25 +2869,47 @@ class MusicBot(discord.Client):
                 await asyncio.sleep(5)
                 await self.safe_delete_message(message, quiet=True)
 
+    @classmethod
+    def _get_command_names(cls):
+        """
+        Returns the sorted names of all non-dev commands.
+        Commands can't change at runtime, so the class is only walked once.
+        """
+        if cls._command_names is None:
+            seen = set()
+            names = []
+            for klass in cls.__mro__:
+                for att, val in vars(klass).items():
+                    if not att.startswith('cmd_') or att in seen:
+                        continue
+
+                    seen.add(att)
+                    # dev_only sets dev_cmd on the wrapper, so check its __dict__ instead of a full getattr
+                    if 'dev_cmd' not in getattr(val, '__dict__', ()):
+                        names.append(att[len('cmd_'):].lower())
+
+            cls._command_names = sorted(names)
+
+        return cls._command_names
+
     async def gen_cmd_list(self, message, list_all_cmds=False):
-        for att in dir(self):
-            # This will always return at least cmd_help, since they needed perms to run this command
-            if att.startswith('cmd_') and not hasattr(getattr(self, att), 'dev_cmd'):
-                user_permissions = self.permissions.for_user(message.author)
-                command_name = att.replace('cmd_', '').lower()
-                whitelist = user_permissions.command_whitelist
-                blacklist = user_permissions.command_blacklist
-                if list_all_cmds:
-                    self.commands.append('{}{}'.format(self.config.command_prefix, command_name))
-
-                elif blacklist and command_name in blacklist:
-                    pass
-
-                elif whitelist and command_name not in whitelist:
-                    pass
+        user_permissions = self.permissions.for_user(message.author)
+        whitelist = user_permissions.command_whitelist
+        blacklist = user_permissions.command_blacklist
 
-                else:
-                    self.commands.append("{}{}".format(self.config.command_prefix, command_name))
+        # This will always return at least cmd_help, since they needed perms to run this command
+        for command_name in self._get_command_names():
+            if list_all_cmds:
+                self.commands.append('{}{}'.format(self.config.command_prefix, command_name))
+
+            elif blacklist and command_name in blacklist:
+                pass
+
+            elif whitelist and command_name not in whitelist:
+                pass
+
+            else:
+                self.commands.append("{}{}".format(self.config.command_prefix, command_name))
 
     async def on_voice_state_update(self, member, before, after):
         if not self.init_ok:
@@ -2900,75 +2927,78 @@ class MusicBot(discord.Client):
 
         autopause_msg = "{state} in {channel.guild.name}/{channel.name} {reason}"
 
-        auto_paused = self.server_specific_data[channel.guild]['auto_paused']
+        ssd = self.server_specific_data[channel.guild]
+        auto_paused = ssd['auto_paused']
 
         try:
             player = await self.get_player(channel)
         except exceptions.CommandError:
             return
 
+        vc_channel = player.voice_client.channel
+
         def is_active(member):
             if not member.voice:
                 return False
                 
-            if any([member.voice.deaf, member.voice.self_deaf, member.bot]):
+            if member.voice.deaf or member.voice.self_deaf or member.bot:
                 return False
 
             return True
 
         if not member == self.user and is_active(member):  # if the user is not inactive
-            if player.voice_client.channel != before.channel and player.voice_client.channel == after.channel:  # if the person joined
+            if vc_channel != before.channel and vc_channel == after.channel:  # if the person joined
                 if auto_paused and player.is_paused:
                     log.info(autopause_msg.format(
                         state = "Unpausing",
-                        channel = player.voice_client.channel,
+                        channel = vc_channel,
                         reason = ""
                     ).strip())
 
-                    self.server_specific_data[player.voice_client.guild]['auto_paused'] = False
+                    ssd['auto_paused'] = False
                     player.resume()
-            elif player.voice_client.channel == before.channel and player.voice_client.channel != after.channel:
-                if not any(is_active(m) for m in player.voice_client.channel.members):  # channel is empty
+            elif vc_channel == before.channel and vc_channel != after.channel:
+                if not any(is_active(m) for m in vc_channel.members):  # channel is empty
                     if not auto_paused and player.is_playing:
                         log.info(autopause_msg.format(
                             state = "Pausing",
-                            channel = player.voice_client.channel,
+                            channel = vc_channel,
                             reason = "(empty channel)"
                         ).strip())
 
-                        self.server_specific_data[player.voice_client.guild]['auto_paused'] = True
+                        ssd['auto_paused'] = True
                         player.pause()
-            elif player.voice_client.channel == before.channel and player.voice_client.channel == after.channel:  # if the person undeafen
+            elif vc_channel == before.channel and vc_channel == after.channel:  # if the person undeafen
                 if auto_paused and player.is_paused:
                     log.info(autopause_msg.format(
                         state = "Unpausing",
-                        channel = player.voice_client.channel,
+                        channel = vc_channel,
                         reason = "(member undeafen)"
                     ).strip())
 
-                    self.server_specific_data[player.voice_client.guild]['auto_paused'] = False
+                    ssd['auto_paused'] = False
                     player.resume()
         else:
-            if any(is_active(m) for m in player.voice_client.channel.members):  # channel is not empty
+            if any(is_active(m) for m in vc_channel.members):  # channel is not empty
                 if auto_paused and player.is_paused:
                     log.info(autopause_msg.format(
                         state = "Unpausing",
-                        channel = player.voice_client.channel,
+                        channel = vc_channel,
                         reason = ""
                     ).strip())
  
-                    self.server_specific_data[player.voice_client.guild]['auto_paused'] = False
+                    ssd['auto_paused'] = False
                     player.resume()
 
             else:
                 if not auto_paused and player.is_playing:
                     log.info(autopause_msg.format(
                         state = "Pausing",
-                        channel = player.voice_client.channel,
+                        channel = vc_channel,
                         reason = "(empty channel or member deafened)"
                     ).strip())
 
-                    self.server_specific_data[player.voice_client.guild]['auto_paused'] = True
+                    ssd['auto_paused'] = True
                     player.pause()
 
     async def on_guild_update(self, before:discord.Guild, after:discord.Guild):
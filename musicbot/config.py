@@ -94,12 +94,10 @@ class Config:
         self.find_autoplaylist()
 
     def get_all_keys(self, conf):
-        """Returns all config keys as a list"""
-        sects = dict(conf.items())
-        keys = []
-        for k in sects:
-            s = sects[k]
-            keys += [key for key in s.keys()]
+        """Returns all config keys as a set"""
+        keys = set()
+        for section in conf.values():
+            keys.update(section.keys())
         return keys
 
     def check_changes(self, conf):
@@ -110,8 +108,7 @@ class Config:
             if not exconf.read(exfile, encoding='utf-8'):
                 return
             ex_keys = self.get_all_keys(exconf)
-            if set(usr_keys) != set(ex_keys):
-                self.missing_keys = set(ex_keys) - set(usr_keys)  # to raise this as an issue in bot.py later
+            self.missing_keys = ex_keys - usr_keys  # to raise this as an issue in bot.py later
 
     def run_checks(self):
         """
@@ -165,7 +165,11 @@ class URLPlaylistEntry(BasePlaylistEntry):
 
             # the generic extractor requires special handling
             if extractor == 'generic':
-                flistdir = [f.rsplit('-', 1)[0] for f in os.listdir(self.download_folder)]
+                # map each cached name (minus its hash suffix) to the first file that has it
+                flistdir = {}
+                for f in os.listdir(self.download_folder):
+                    flistdir.setdefault(f.rsplit('-', 1)[0], f)
+
                 expected_fname_noex, fname_ex = os.path.basename(self.expected_filename).rsplit('.', 1)
 
                 if expected_fname_noex in flistdir:
@@ -174,10 +178,7 @@ class URLPlaylistEntry(BasePlaylistEntry):
                     except:
                         rsize = 0
 
-                    lfile = os.path.join(
-                        self.download_folder,
-                        os.listdir(self.download_folder)[flistdir.index(expected_fname_noex)]
-                    )
+                    lfile = os.path.join(self.download_folder, flistdir[expected_fname_noex])
 
                     # print("Resolved %s to %s" % (self.expected_filename, lfile))
                     lsize = os.path.getsize(lfile)
@@ -195,7 +196,12 @@ class URLPlaylistEntry(BasePlaylistEntry):
 
             else:
                 ldir = os.listdir(self.download_folder)
-                flistdir = [f.rsplit('.', 1)[0] for f in ldir]
+
+                # map each cached name (minus its extension) to the first file that has it
+                flistdir = {}
+                for f in ldir:
+                    flistdir.setdefault(f.rsplit('.', 1)[0], f)
+
                 expected_fname_base = os.path.basename(self.expected_filename)
                 expected_fname_noex = expected_fname_base.rsplit('.', 1)[0]
 
@@ -208,7 +214,7 @@ class URLPlaylistEntry(BasePlaylistEntry):
 
                 elif expected_fname_noex in flistdir:
                     log.info("Download cached (different extension): {}".format(self.url))
-                    self.filename = os.path.join(self.download_folder, ldir[flistdir.index(expected_fname_noex)])
+                    self.filename = os.path.join(self.download_folder, flistdir[expected_fname_noex])
                     log.debug("Expected {}, got {}".format(
                         self.expected_filename.rsplit('.', 1)[-1],
                         self.filename.rsplit('.', 1)[-1]
@@ -1,8 +1,13 @@
+import os
+import copy
 import json
 import logging
 
 log = logging.getLogger(__name__)
 
+# Parsed files keyed by path, stored as (mtime, size, data) so a restart doesn't re-parse unchanged files
+_parse_cache = {}
+
 class Json:
     def __init__(self, json_file):
         log.debug('Init JSON obj with {0}'.format(json_file))
@@ -11,13 +16,23 @@ class Json:
 
     def parse(self):
         """Parse the file as JSON"""
+        st = os.stat(self.file)
+        path = os.path.abspath(self.file)
+
+        cached = _parse_cache.get(path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            log.debug('Using cached parse of {0}'.format(self.file))
+            return copy.copy(cached[2])
+
         with open(self.file, encoding='utf-8') as data:
             try:
                 parsed = json.load(data)
             except Exception:
                 log.error('Error parsing {0} as JSON'.format(self.file), exc_info=True)
-                parsed = {}
-        return parsed
+                return {}
+
+        _parse_cache[path] = (st.st_mtime_ns, st.st_size, parsed)
+        return copy.copy(parsed)
 
     def get(self, item, fallback=None):
         """Gets an item from a JSON file"""
@@ -117,10 +117,10 @@ class Permissions:
             return self.default_group
 
         # We loop again so that we don't return a role based group before we find an assigned one
+        role_ids = {role.id for role in user.roles}
         for group in self.groups:
-            for role in user.roles:
-                if role.id in group.granted_to_roles:
-                    return group
+            if not role_ids.isdisjoint(group.granted_to_roles):
+                return group
 
         return self.default_group
 
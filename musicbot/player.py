@@ -213,7 +213,7 @@ class MusicPlayer(EventEmitter, Serializable):
 
         if not self.bot.config.save_videos and entry:
             if not isinstance(entry, StreamPlaylistEntry):
-                if any([entry.filename == e.filename for e in self.playlist.entries]):
+                if any(entry.filename == e.filename for e in self.playlist.entries):
                     log.debug("Skipping deletion of \"{}\", found song in queue".format(entry.filename))
 
                 else:
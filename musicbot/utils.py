@@ -28,9 +28,7 @@ def load_file(filename, skip_commented_lines=True, comment_char='#'):
 
 def write_file(filename, contents):
     with open(filename, 'w', encoding='utf8') as f:
-        for item in contents:
-            f.write(str(item))
-            f.write('\n')
+        f.writelines('{}\n'.format(item) for item in contents)
 
 def paginate(content, *, length=DISCORD_MSG_CHAR_LIMIT, reserve=0):
     """